@@ -33,6 +33,7 @@ Flute Sender python example
     flute_sender.publish()
 
     while True:
+        # alc_pkt is a bytes object, or None when there is nothing left to send
         alc_pkt = flute_sender.read()
         if alc_pkt == None:
             break
@@ -60,5 +61,5 @@ Flute Receiver python example
         pkt = receive_from_udp_socket()
 
         # Push packet to the flute receiver
-        flute_receiver.push(bytes(pkt))
+        flute_receiver.push(pkt)
 ```
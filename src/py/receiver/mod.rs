@@ -2,8 +2,8 @@ use pyo3::prelude::*;
 
 mod config;
 mod flutewriter;
-mod multireceiver;
-mod receiverpy;
+pub(in crate::py) mod multireceiver;
+pub(in crate::py) mod receiverpy;
 
 #[pymodule]
 pub fn receiver(_py: Python, m: &PyModule) -> PyResult<()> {
@@ -5,7 +5,7 @@ use std::time::SystemTime;
 
 #[pyclass(unsendable)]
 #[derive(Debug)]
-pub struct MultiReceiver(alc::multireceiver::MultiReceiver);
+pub struct MultiReceiver(pub(in crate::py) alc::multireceiver::MultiReceiver);
 
 #[pymethods]
 impl MultiReceiver {
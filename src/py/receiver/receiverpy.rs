@@ -5,7 +5,7 @@ use std::time::SystemTime;
 
 #[pyclass(unsendable)]
 #[derive(Debug)]
-pub struct Receiver(alc::receiver::Receiver);
+pub struct Receiver(pub(in crate::py) alc::receiver::Receiver);
 
 #[pymethods]
 impl Receiver {
@@ -1,6 +1,8 @@
 use crate::alc;
+use crate::py::receiver::{multireceiver, receiverpy};
 use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use std::time::SystemTime;
 
 use super::config;
@@ -101,7 +103,64 @@ impl Sender {
             .map_err(|e| PyTypeError::new_err(e.0.to_string()))
     }
 
-    fn read(&mut self) -> PyResult<Option<Vec<u8>>> {
-        Ok(self.0.read(SystemTime::now()))
+    fn read(&mut self, py: Python) -> PyResult<Option<Py<PyBytes>>> {
+        Ok(self
+            .0
+            .read(SystemTime::now())
+            .map(|pkt| PyBytes::new(py, &pkt).into()))
+    }
+
+    fn read_all(&mut self, py: Python) -> PyResult<Vec<Py<PyBytes>>> {
+        let mut pkts = Vec::new();
+        while let Some(pkt) = self.0.read(SystemTime::now()) {
+            pkts.push(PyBytes::new(py, &pkt).into());
+        }
+        Ok(pkts)
+    }
+
+    /// Add an object from a buffer, publish the FDT and read all pending packets.
+    /// The returned packets are not limited to the new object: every object
+    /// already queued on the sender is drained as well.
+    #[args(oti = "None")]
+    fn transmit_object(
+        &mut self,
+        py: Python,
+        content: &[u8],
+        content_type: &str,
+        content_location: &str,
+        oti: Option<&oti::Oti>,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        self.add_object_from_buffer(content, content_type, content_location, oti)?;
+        self.publish()?;
+        self.read_all(py)
+    }
+
+    fn pump_to(&mut self, receiver: &PyAny) -> PyResult<()> {
+        if let Ok(cell) = receiver.downcast::<PyCell<receiverpy::Receiver>>() {
+            let mut receiver = cell.try_borrow_mut()?;
+            return self.pump(|pkt, now| receiver.0.push_data(pkt, now));
+        }
+
+        if let Ok(cell) = receiver.downcast::<PyCell<multireceiver::MultiReceiver>>() {
+            let mut receiver = cell.try_borrow_mut()?;
+            return self.pump(|pkt, now| receiver.0.push(pkt, now));
+        }
+
+        Err(PyTypeError::new_err("Expected a Receiver or a MultiReceiver"))
+    }
+}
+
+impl Sender {
+    fn pump<F>(&mut self, mut push: F) -> PyResult<()>
+    where
+        F: FnMut(&[u8], SystemTime) -> crate::tools::error::Result<()>,
+    {
+        loop {
+            let now = SystemTime::now();
+            match self.0.read(now) {
+                Some(pkt) => push(&pkt, now).map_err(|e| PyTypeError::new_err(e.0.to_string()))?,
+                None => return Ok(()),
+            }
+        }
     }
 }
@@ -1,40 +1,47 @@
 from unittest import TestCase
 import logging
+import unittest
+
+try:
+    from flute import sender, receiver
+    _flute_available = True
+except ImportError:
+    _flute_available = False
+
+
+FORMAT = '%(levelname)s %(name)s %(asctime)-15s %(filename)s:%(lineno)d %(message)s'
 
 
 def init():
-    FORMAT = '%(levelname)s %(name)s %(asctime)-15s %(filename)s:%(lineno)d %(message)s'
-    logging.basicConfig(format=FORMAT)
-    logging.getLogger().setLevel(logging.DEBUG)
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(format=FORMAT, level=logging.DEBUG)
 
 
+init()
+
+
+@unittest.skipUnless(_flute_available, "flute native ext not built")
 class SenderReceiverTestCase(TestCase):
-    
-    
-    init()
+
+    @classmethod
+    def setUpClass(cls):
+        cls._sender_config = sender.Config()
+        cls._oti = sender.Oti.new_no_code(1400, 64)
 
     def test_create_sender(self):
-        from flute import sender
         print("------- test_create_sender--------")
-        config = sender.Config()
-        oti = sender.Oti.new_no_code(1400, 64)
-        flute_sender = sender.Sender(1, oti, config)
+        flute_sender = sender.Sender(1, self._oti, self._sender_config)
 
-        buf = bytes(b'hello')
-        flute_sender.add_object_from_buffer(buf, "text", "file://hello.txt", None)
-        flute_sender.publish()
-
-        while True:
-            pkt = flute_sender.read()
-            if pkt == None:
-                break
+        nb_pkts = 0
+        for _ in flute_sender.transmit_object(b'hello', "text", "file://hello.txt"):
+            nb_pkts += 1
 
-            print("Received pkt of " + str(len(pkt)) + " bytes")
+        assert(nb_pkts > 0)
+        assert(flute_sender.nb_objects() == 1)
 
         print("File transmitted !")
 
     def test_create_receiver(self):
-        from flute import receiver
         print("------- test_create_receiver--------")
         writer = receiver.FluteWriter.new_buffer()
         config = receiver.Config()
@@ -42,7 +49,6 @@ class SenderReceiverTestCase(TestCase):
         print("Flute Receiver created !")
 
     def test_create_multireceiver(self):
-        from flute import receiver
         print("------- test_create_multireceiver--------")
 
         writer = receiver.FluteWriter.new_buffer()
@@ -53,65 +59,69 @@ class SenderReceiverTestCase(TestCase):
 
 
     def test_send_receiver(self):
-        from flute import sender, receiver
-
         print("------- test_send_receiver--------")
 
         tsi = 1
 
-        sender_config = sender.Config()
-        oti = sender.Oti.new_no_code(1400, 64)
-        flute_sender = sender.Sender(tsi, oti, sender_config)
+        flute_sender = sender.Sender(tsi, self._oti, self._sender_config)
 
         receiver_writer = receiver.FluteWriter.new_buffer()
         receiver_config = receiver.Config()
         flute_receiver = receiver.Receiver(tsi, receiver_writer, receiver_config)
 
-        buf = bytes(b'hello world')
+        buf = b'hello world'
         flute_sender.add_object_from_buffer(buf, "text", "file://hello.txt", None)
         flute_sender.publish()
 
-        while True:
-            pkt = flute_sender.read()
-            if pkt == None:
-                break
-
-            flute_receiver.push(bytes(pkt))
+        flute_sender.pump_to(flute_receiver)
+        assert(flute_sender.read() == None)
 
     def test_send_multi_receiver(self):
-        from flute import sender, receiver
-
         print("------- test_send_multi_receiver--------")
 
         tsi = 1
 
-        sender_config = sender.Config()
-        oti = sender.Oti.new_no_code(1400, 64)
-        flute_sender = sender.Sender(tsi, oti, sender_config)
+        flute_sender = sender.Sender(tsi, self._oti, self._sender_config)
 
         receiver_writer = receiver.FluteWriter.new_buffer()
         receiver_config = receiver.Config()
         flute_receiver = receiver.MultiReceiver(None, receiver_writer, receiver_config)
 
-        buf = bytes(b'hello world')
+        buf = b'hello world'
         flute_sender.add_object_from_buffer(buf, "text", "file://hello.txt", None)
         flute_sender.publish()
 
-        while True:
+        flute_sender.pump_to(flute_receiver)
+        assert(flute_sender.read() == None)
+
+    def test_read(self):
+        print("------- test_read--------")
+        tsi = 1
+        flute_sender = sender.Sender(tsi, self._oti, self._sender_config)
+
+        receiver_writer = receiver.FluteWriter.new_buffer()
+        receiver_config = receiver.Config()
+        flute_receiver = receiver.Receiver(tsi, receiver_writer, receiver_config)
+
+        flute_sender.add_object_from_buffer(b'hello world', "text", "file://hello.txt", None)
+        flute_sender.publish()
+
+        pkt = flute_sender.read()
+        assert(isinstance(pkt, bytes))
+        while pkt != None:
+            flute_receiver.push(pkt)
             pkt = flute_sender.read()
-            if pkt == None:
-                break
 
-            flute_receiver.push(bytes(pkt))
+    def test_pump_to_invalid_receiver(self):
+        print("------- test_pump_to_invalid_receiver--------")
+        flute_sender = sender.Sender(1, self._oti, self._sender_config)
+        self.assertRaises(TypeError, flute_sender.pump_to, object())
 
     def test_remove_object(self):
-        from flute import sender
         print("------- test_remove_object--------")
-        config = sender.Config()
-        oti = sender.Oti.new_no_code(1400, 64)
-        flute_sender = sender.Sender(1, oti, config)
+        flute_sender = sender.Sender(1, self._oti, self._sender_config)
 
-        buf = bytes(b'hello')
+        buf = b'hello'
         toi = flute_sender.add_object_from_buffer(buf, "text", "file://hello.txt", None)
         print("object with TOI " + str(toi) + " added")
         assert(flute_sender.nb_objects() == 1)